@@ -14,7 +14,10 @@ DESCRIPTION = "A secure Flask web application template with MVC architecture"
 # Application Constants
 DEFAULT_PAGINATION = 20
 SESSION_TIMEOUT = 600  # 10 minutes (used in PERMANENT_SESSION_LIFETIME)
+SESSION_TOUCH_INTERVAL = 30  # seconds between session activity timestamp writes
 PASSWORD_MIN_LENGTH = 8
+BCRYPT_LOG_ROUNDS = 12  # bcrypt work factor, override with BCRYPT_LOG_ROUNDS in .env
+PASSWORD_KDF = "bcrypt"  # "bcrypt" or "argon2" (argon2 requires argon2-cffi)
 MAX_LOGIN_ATTEMPTS = 5
 
 # Feature Flags
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Expired session cleanup script for Flask MVC Base Template.
+
+Run this script from a scheduler (e.g. cron every few minutes) to delete
+coat hanger sessions that have timed out.
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src import create_app
+from src.services.user_services import AuthService
+
+
+if __name__ == "__main__":
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            count = AuthService.cleanup_expired_sessions()
+            print(f"Removed {count} expired session(s)")
+            
+        except Exception as e:
+            print(f"Error during session cleanup: {str(e)}")
+            sys.exit(1)
@@ -1,5 +1,7 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 import os
 from dotenv import load_dotenv
 import app_config
@@ -22,8 +24,25 @@ def configure_app(app):
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # SQLite journal tuning is opt-in; unset keeps SQLite's own defaults
+    app.config['SQLITE_WAL'] = os.environ.get('SQLITE_WAL', 'False').lower() == 'true'
+    sqlite_synchronous = os.environ.get('SQLITE_SYNCHRONOUS')
+    app.config['SQLITE_SYNCHRONOUS'] = sqlite_synchronous.upper() if sqlite_synchronous else None
     app.config['SESSION_PERMANENT'] = False
     app.config['PERMANENT_SESSION_LIFETIME'] = app_config.SESSION_TIMEOUT
+    app.config['BCRYPT_LOG_ROUNDS'] = int(os.environ.get('BCRYPT_LOG_ROUNDS', app_config.BCRYPT_LOG_ROUNDS))
+    app.config['PASSWORD_KDF'] = os.environ.get('PASSWORD_KDF', app_config.PASSWORD_KDF).lower()
+    app.config['SESSION_TOUCH_INTERVAL'] = app_config.SESSION_TOUCH_INTERVAL
+    # In-process session cache; only safe with a single worker process
+    app.config['SESSION_CACHE_ENABLED'] = os.environ.get('SESSION_CACHE_ENABLED', 'False').lower() == 'true'
+    
+    # In-memory SQLite (e.g. DATABASE_URL=sqlite:///:memory: for tests) must reuse
+    # one connection, otherwise every pooled connection sees an empty database
+    if app.config['SQLALCHEMY_DATABASE_URI'] in ('sqlite://', 'sqlite:///:memory:'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            'poolclass': StaticPool,
+            'connect_args': {'check_same_thread': False},
+        }
     
     # Optional email configuration from .env
     app.config['MAIL_SERVER'] = os.environ.get('MAIL_SERVER')
@@ -45,7 +64,9 @@ def configure_app(app):
     app.config['ENABLE_PASSWORD_RESET'] = app_config.ENABLE_PASSWORD_RESET
     app.config['DEFAULT_THEME'] = app_config.DEFAULT_THEME
     app.config['ITEMS_PER_PAGE'] = app_config.ITEMS_PER_PAGE
-    app.config['MAX_FILE_UPLOAD_SIZE'] = app_config.MAX_FILE_UPLOAD_SIZE
+    app.config['MAX_FILE_UPLOAD_SIZE'] = int(os.environ.get('MAX_FILE_UPLOAD_SIZE', app_config.MAX_FILE_UPLOAD_SIZE))
+    # Let Flask reject oversized request bodies before they are read
+    app.config['MAX_CONTENT_LENGTH'] = app.config['MAX_FILE_UPLOAD_SIZE']
 
 
     # Make csrf_token available globally in templates
@@ -76,6 +97,38 @@ def setup_template_globals(app):
             'current_user': AuthService.get_current_user()
         }
 
+def setup_sqlite_pragmas(app):
+    """
+    Apply opt-in SQLite pragmas to every new connection.
+    
+    SQLITE_WAL=True switches to WAL journaling, which lets readers run
+    alongside the writer and, with SQLITE_SYNCHRONOUS=NORMAL, only syncs at
+    checkpoints instead of on every commit. SQLITE_SYNCHRONOUS=OFF is meant
+    for throwaway test databases. With neither set, no hook is registered.
+    
+    Args:
+        app (Flask): Flask application instance
+    """
+    if db.engine.dialect.name != 'sqlite':
+        return
+    
+    use_wal = app.config['SQLITE_WAL']
+    synchronous = app.config['SQLITE_SYNCHRONOUS']
+    if not use_wal and synchronous is None:
+        return
+    
+    if synchronous is not None and synchronous not in ('OFF', 'NORMAL', 'FULL', 'EXTRA'):
+        raise ValueError(f"Invalid SQLITE_SYNCHRONOUS value: {synchronous}")
+    
+    @event.listens_for(db.engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if use_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        if synchronous is not None:
+            cursor.execute(f"PRAGMA synchronous={synchronous}")
+        cursor.close()
+
 def init_db(app):
     """
     Initialize database with the Flask application.
@@ -86,6 +139,8 @@ def init_db(app):
     """
     db.init_app(app)
     with app.app_context():
+        setup_sqlite_pragmas(app)
+        
         # Import all models so SQLAlchemy knows about them
         from src.models.user_model import User
         from src.models.coat_hanger import CoatHanger
@@ -95,8 +95,7 @@ def settings():
 @login_required
 def logout():
     """User logout - clears session and coat hanger"""
-    user_id = session.get('user_id')
-    AuthService.logout_user(user_id)
+    AuthService.logout_user()
     flash('You have been logged out successfully.', 'info')
     return redirect(url_for('main.index'))
 
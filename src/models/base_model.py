@@ -82,29 +82,42 @@ class BaseModel(db.Model):
     @classmethod
     def get_by_id(cls, id):
         """Retrieve a record by its primary key."""
-        return cls.query.get(id)
+        return db.session.get(cls, id)
     
     @classmethod
     def get_all(cls):
         """Retrieve all records for this model."""
-        return cls.query.all()
+        return db.session.query(cls).all()
     
     @classmethod
     def find_by(cls, **kwargs):
         """Find records by specified criteria."""
-        return cls.query.filter_by(**kwargs).all()
+        return db.session.query(cls).filter_by(**kwargs).all()
     
     @classmethod
     def find_one_by(cls, **kwargs):
         """Find a single record by specified criteria."""
-        return cls.query.filter_by(**kwargs).first()
+        return db.session.query(cls).filter_by(**kwargs).first()
+    
+    @classmethod
+    def exists_by(cls, **kwargs):
+        """Check whether any record matches the criteria without loading it."""
+        return db.session.query(
+            db.session.query(cls).filter_by(**kwargs).exists()
+        ).scalar()
+    
+    @classmethod
+    def _column_names(cls):
+        """Return the table's column names, computed once per model class."""
+        names = cls.__dict__.get('_column_names_cache')
+        if names is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            cls._column_names_cache = names
+        return names
     
     def to_dict(self):
         """Convert model instance to dictionary representation."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return {name: getattr(self, name) for name in self._column_names()}
     
     def __repr__(self):
         """String representation of the model instance."""
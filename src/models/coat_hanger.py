@@ -1,3 +1,5 @@
+import secrets
+from sqlalchemy import select, bindparam
 from src.models.base_model import BaseModel
 from src import db
 
@@ -10,10 +12,17 @@ class CoatHanger(BaseModel):
     """
     
     __tablename__ = 'coat_hanger'
+    __table_args__ = (
+        # Per-user session listing/cleanup and the expired-session sweep
+        db.Index('ix_coat_hanger_user_updated', 'user_id', 'updated_at'),
+        db.Index('ix_coat_hanger_updated_at', 'updated_at'),
+    )
     
     user_id = db.Column(db.Integer, db.ForeignKey('user._id'), nullable=False)
     session_hash = db.Column(db.String(255), unique=True, nullable=False, index=True)
-    user_data = db.Column(db.JSON)  # Store serialized user data for quick access
+    # Store serialized user data for quick access. Deferred so per-request
+    # session lookups do not read the JSON blob unless it is used.
+    user_data = db.deferred(db.Column(db.JSON))
     
     # Relationships
     user = db.relationship('User', backref=db.backref('sessions', lazy='dynamic'))
@@ -22,17 +31,26 @@ class CoatHanger(BaseModel):
         return f'<CoatHanger user_id={self.user_id}, session_hash={self.session_hash[:8]}...>'
     
 
+    @classmethod
+    def find_by_session_hash(cls, session_hash):
+        """Find the session record for a session token."""
+        return db.session.execute(
+            _FIND_BY_SESSION_HASH, {'session_hash': session_hash}
+        ).scalar_one_or_none()
+    
     @staticmethod
-    def generate_session_token(user):
-        """Generate a new session token for the given user."""
-        import hashlib
-        import os
-        raw_token = f"{user.id}-{os.urandom(16).hex()}"
-        session_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-        return session_hash
+    def generate_session_token():
+        """Generate a new random session token (256 bits, URL-safe)."""
+        return secrets.token_urlsafe(32)
     
     @property
     def user(self):
         """Return the associated user object."""
         from src.models.user_model import User
-        return User.query.get(self.user_id)
\ No newline at end of file
+        return User.get_by_id(self.user_id)
+
+
+# Lookup statement built once at import and reused for every call
+_FIND_BY_SESSION_HASH = select(CoatHanger).where(
+    CoatHanger.session_hash == bindparam('session_hash')
+)
@@ -1,3 +1,4 @@
+from sqlalchemy import select, bindparam
 from src.models.base_model import BaseModel
 from src import db
 
@@ -20,6 +21,13 @@ class User(BaseModel):
         lazy='dynamic'
     )
     
+    @classmethod
+    def find_by_email(cls, email):
+        """Find a user by normalized email address."""
+        return db.session.execute(
+            _FIND_BY_EMAIL, {'email': email}
+        ).scalar_one_or_none()
+    
     def has_role(self, role_name):
         """Check if user has a specific role."""
         return self.roles.filter_by(name=role_name).first() is not None
@@ -39,4 +47,8 @@ class User(BaseModel):
         return [role.name for role in self.roles.all()]
     
     def __repr__(self):
-        return f'<User {self.email}>'
\ No newline at end of file
+        return f'<User {self.email}>'
+
+
+# Lookup statement built once at import and reused for every call
+_FIND_BY_EMAIL = select(User).where(User.email == bindparam('email'))
@@ -1,8 +1,11 @@
 from functools import wraps
-from flask import session, redirect, url_for, request, g
+from flask import session, redirect, url_for, request, g, current_app
 from src.models.coat_hanger import CoatHanger
+from src.models.user_model import User
+from src.utils.session_cache_utils import get_cached_session, cache_session
+from src.utils import time_utils
 from src import db
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 def login_required(f):
     """
@@ -18,14 +21,28 @@ def login_required(f):
         if not session_token:
             return redirect(url_for('user.login'))
         
+        touch_interval_seconds = current_app.config['SESSION_TOUCH_INTERVAL']
+        cache_enabled = current_app.config['SESSION_CACHE_ENABLED']
+        
+        # With the opt-in session cache, recently validated sessions skip the
+        # CoatHanger lookup; the user is still loaded from the database
+        if cache_enabled:
+            cached_user_id = get_cached_session(session_token, touch_interval_seconds)
+            if cached_user_id is not None:
+                cached_user = User.get_by_id(cached_user_id)
+                if cached_user:
+                    g.current_user_id = cached_user_id
+                    g.current_user = cached_user
+                    return f(*args, **kwargs)
+        
         # Validate session token in database
-        coat_hanger = CoatHanger.query.filter_by(session_hash=session_token).first()
+        coat_hanger = CoatHanger.find_by_session_hash(session_token)
         if not coat_hanger:
             session.clear()
             return redirect(url_for('user.login'))
         
         # Check session timeout (10 minutes)
-        timeout_threshold = datetime.utcnow() - timedelta(minutes=10)
+        timeout_threshold = time_utils.utcnow() - timedelta(minutes=10)
         if coat_hanger.updated_at < timeout_threshold:
             # Session expired - clean up
             db.session.delete(coat_hanger)
@@ -33,9 +50,13 @@ def login_required(f):
             session.clear()
             return redirect(url_for('user.login'))
         
-        # Update session timestamp
-        coat_hanger.updated_at = datetime.utcnow()
-        db.session.commit()
+        # Update session timestamp, coalescing writes within the touch interval
+        now = time_utils.utcnow()
+        if now - coat_hanger.updated_at >= timedelta(seconds=touch_interval_seconds):
+            coat_hanger.updated_at = now
+            db.session.commit()
+        if cache_enabled:
+            cache_session(session_token, coat_hanger.user_id, coat_hanger.updated_at)
         
         # Store user info in g for use in templates and logic
         g.current_user_id = coat_hanger.user_id
@@ -7,13 +7,14 @@ database operations to the models.
 """
 
 import bcrypt
-import secrets
-from datetime import datetime, timedelta
-from flask import session, g
+from datetime import timedelta
+from flask import session, g, current_app
 from sqlalchemy.exc import IntegrityError
 from src import db
 from src.models.user_model import User
 from src.models.coat_hanger import CoatHanger
+from src.utils.session_cache_utils import invalidate_session, invalidate_user_sessions
+from src.utils import time_utils
 
 
 class UserService:
@@ -40,15 +41,11 @@ class UserService:
         """
         try:
             # Check if user already exists
-            existing_user = User.find_one_by(email=email.lower().strip())
-            if existing_user:
+            if User.exists_by(email=email.lower().strip()):
                 return None, False, "A user with this email already exists"
             
             # Hash the password
-            password_hash = bcrypt.hashpw(
-                password.encode('utf-8'), 
-                bcrypt.gensalt(rounds=12)
-            ).decode('utf-8')
+            password_hash = AuthService.hash_password(password)
             
             # Create user
             user = User.create(
@@ -90,7 +87,7 @@ class UserService:
         Returns:
             User: User object or None if not found
         """
-        return User.find_one_by(email=email.lower().strip())
+        return User.find_by_email(email.lower().strip())
     
     @staticmethod
     def update_user_profile(user_id, **kwargs):
@@ -113,8 +110,7 @@ class UserService:
             if 'email' in kwargs:
                 new_email = kwargs['email'].lower().strip()
                 if new_email != user.email:
-                    existing_user = User.find_one_by(email=new_email)
-                    if existing_user:
+                    if User.exists_by(email=new_email):
                         return None, False, "A user with this email already exists"
                     kwargs['email'] = new_email
             
@@ -151,17 +147,16 @@ class UserService:
                 return False, "User not found"
             
             # Verify current password
-            if not bcrypt.checkpw(
-                current_password.encode('utf-8'), 
-                user.password_hash.encode('utf-8')
-            ):
+            if not AuthService.verify_password(current_password, user.password_hash):
                 return False, "Current password is incorrect"
             
+            # Apply the same policy as registration
+            is_valid, error = AuthService.validate_password_strength(new_password)
+            if not is_valid:
+                return False, error
+            
             # Hash new password
-            new_password_hash = bcrypt.hashpw(
-                new_password.encode('utf-8'), 
-                bcrypt.gensalt(rounds=12)
-            ).decode('utf-8')
+            new_password_hash = AuthService.hash_password(new_password)
             
             # Update password
             user.update(password_hash=new_password_hash)
@@ -227,13 +222,21 @@ class UserService:
             list: List of user dictionaries with role information
         """
         try:
-            from src.models.role_model import Role
+            from src.models.role_model import Role, user_role
             users = User.get_all()
             users_data = []
             
+            # Load every user's role names in one query instead of one per user
+            roles_by_user = {}
+            role_rows = db.session.query(user_role.c.user_id, Role.name).join(
+                Role, Role._id == user_role.c.role_id
+            )
+            for user_id, role_name in role_rows:
+                roles_by_user.setdefault(user_id, []).append(role_name)
+            
             for user in users:
                 user_dict = user.to_dict()
-                user_dict['roles'] = [role.name for role in user.roles]
+                user_dict['roles'] = roles_by_user.get(user.id, [])
                 # Ensure these fields exist, default to safe values if not
                 user_dict['is_active'] = getattr(user, 'is_active', True)
                 user_dict['force_password_change'] = getattr(user, 'force_password_change', False)
@@ -381,6 +384,75 @@ class AuthService:
     using the custom "coat hanger" session system.
     """
     
+    @staticmethod
+    def _argon2_hasher():
+        """Build an Argon2id hasher, with minimal cost parameters in TESTING mode."""
+        from argon2 import PasswordHasher
+        
+        if current_app.config.get('TESTING'):
+            return PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+        return PasswordHasher()
+    
+    @staticmethod
+    def hash_password(password):
+        """
+        Hash a plain text password with the configured PASSWORD_KDF.
+        
+        bcrypt (the default) takes its work factor from BCRYPT_LOG_ROUNDS, or
+        its minimum of 4 when the app is in TESTING mode. argon2 uses Argon2id
+        and requires the argon2-cffi package.
+        
+        Args:
+            password (str): Plain text password
+            
+        Returns:
+            str: Password hash
+        """
+        kdf = current_app.config['PASSWORD_KDF']
+        if kdf == 'argon2':
+            return AuthService._argon2_hasher().hash(password)
+        if kdf != 'bcrypt':
+            raise ValueError(f"Unsupported PASSWORD_KDF: {kdf}")
+        
+        rounds = current_app.config['BCRYPT_LOG_ROUNDS']
+        if current_app.config.get('TESTING'):
+            rounds = 4
+        
+        return bcrypt.hashpw(
+            password.encode('utf-8'),
+            bcrypt.gensalt(rounds=rounds)
+        ).decode('utf-8')
+    
+    @staticmethod
+    def verify_password(password, password_hash):
+        """
+        Check a plain text password against a stored bcrypt or Argon2 hash.
+        
+        The algorithm is picked from the hash prefix, so existing hashes keep
+        working when PASSWORD_KDF changes. Malformed hashes are rejected up
+        front instead of raising from the hashing library.
+        
+        Args:
+            password (str): Plain text password
+            password_hash (str): Stored password hash
+            
+        Returns:
+            bool: True if the password matches
+        """
+        if isinstance(password_hash, str) and password_hash.startswith('$argon2'):
+            from argon2.exceptions import InvalidHashError, VerificationError
+            
+            try:
+                return AuthService._argon2_hasher().verify(password_hash, password)
+            except (InvalidHashError, VerificationError):
+                return False
+        
+        if (not isinstance(password_hash, str) or len(password_hash) != 60
+                or not password_hash.startswith(('$2a$', '$2b$', '$2y$'))):
+            return False
+        
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    
     @staticmethod
     def authenticate_user(credentials):
         """
@@ -397,7 +469,7 @@ class AuthService:
             email = credentials.get('email', '').lower().strip()
             password = credentials.get('password', '')
             # Find user by email
-            user = User.find_one_by(email=email.lower().strip())
+            user = User.find_by_email(email.lower().strip())
             if not user:
                 return {'user': None, 'success': False, 'message': "Invalid email or password"}
             
@@ -406,7 +478,7 @@ class AuthService:
                 return {'user': None, 'success': False, 'message': "Account has been deactivated. Please contact an administrator."}
             
             # Verify password
-            if not bcrypt.checkpw(password.encode('utf-8'), user.password_hash.encode('utf-8')):
+            if not AuthService.verify_password(password, user.password_hash):
                 return {'user': None, 'success': False, 'message': "Invalid email or password"}
             
             # Check if password change is required
@@ -436,30 +508,33 @@ class AuthService:
         """
         try:
             # Generate secure session token
-            session_token = secrets.token_urlsafe(32)
+            session_token = CoatHanger.generate_session_token()
+            
+            login_time = time_utils.utcnow()
             
             # Prepare user data for session storage
             user_data = {
                 'id': user.id,
                 'email': user.email,
                 'full_name': user.full_name,
-                'last_login': datetime.utcnow().isoformat()
+                'last_login': login_time.isoformat()
             }
             
+            # Update user's last login timestamp; committed with the session record
+            user.updated_at = login_time
+            
             # Create coat hanger session record
             coat_hanger = CoatHanger.create(
                 user_id=user.id,
                 session_hash=session_token,
-                user_data=user_data
+                user_data=user_data,
+                updated_at=login_time
             )
             
             # Store session token in Flask session
             session['session_token'] = session_token
             session.permanent = True  # Enable session timeout
             
-            # Update user's last login timestamp
-            user.update(updated_at=datetime.utcnow())
-            
             return True
             
         except Exception as e:
@@ -477,8 +552,10 @@ class AuthService:
         try:
             session_token = session.get('session_token')
             if session_token:
+                invalidate_session(session_token)
+                
                 # Remove session from database
-                coat_hanger = CoatHanger.find_one_by(session_hash=session_token)
+                coat_hanger = CoatHanger.find_by_session_hash(session_token)
                 if coat_hanger:
                     coat_hanger.delete()
             
@@ -502,10 +579,13 @@ class AuthService:
             bool: True if all sessions cleared successfully
         """
         try:
-            # Remove all sessions for this user
-            sessions = CoatHanger.find_by(user_id=user_id)
-            for session_record in sessions:
-                session_record.delete()
+            invalidate_user_sessions(user_id)
+            
+            # Remove all sessions for this user in a single statement
+            db.session.query(CoatHanger).filter_by(
+                user_id=user_id
+            ).delete(synchronize_session=False)
+            db.session.commit()
             
             return True
             
@@ -521,6 +601,11 @@ class AuthService:
         Returns:
             User: Current user object or None if not authenticated
         """
+        # login_required already loaded the user for this request
+        current_user = getattr(g, 'current_user', None)
+        if current_user is not None:
+            return current_user
+        
         user_id = getattr(g, 'current_user_id', None)
         if user_id:
             return User.get_by_id(user_id)
@@ -530,23 +615,20 @@ class AuthService:
     def cleanup_expired_sessions():
         """
         Clean up expired sessions from the database.
-        Should be called periodically to maintain database hygiene.
+        Meant to be run from a scheduled job (see cleanup_sessions.py).
         
         Returns:
             int: Number of expired sessions removed
         """
         try:
             # Calculate timeout threshold (10 minutes)
-            timeout_threshold = datetime.utcnow() - timedelta(minutes=10)
+            timeout_threshold = time_utils.utcnow() - timedelta(minutes=10)
             
-            # Find and delete expired sessions
-            expired_sessions = CoatHanger.query.filter(
+            # Delete expired sessions in a single statement
+            count = db.session.query(CoatHanger).filter(
                 CoatHanger.updated_at < timeout_threshold
-            ).all()
-            
-            count = len(expired_sessions)
-            for session_record in expired_sessions:
-                session_record.delete()
+            ).delete(synchronize_session=False)
+            db.session.commit()
             
             return count
             
@@ -570,19 +652,23 @@ class AuthService:
                 return None, False
             
             # Find session in database
-            coat_hanger = CoatHanger.find_one_by(session_hash=session_token)
+            coat_hanger = CoatHanger.find_by_session_hash(session_token)
             if not coat_hanger:
                 return None, False
             
             # Check if session has expired (10 minutes)
-            timeout_threshold = datetime.utcnow() - timedelta(minutes=10)
+            timeout_threshold = time_utils.utcnow() - timedelta(minutes=10)
             if coat_hanger.updated_at < timeout_threshold:
                 # Session expired - clean up
                 coat_hanger.delete()
                 return None, False
             
-            # Update session timestamp
-            coat_hanger.update(updated_at=datetime.utcnow())
+            # Update session timestamp, coalescing writes within the touch interval
+            now = time_utils.utcnow()
+            touch_interval = timedelta(seconds=current_app.config['SESSION_TOUCH_INTERVAL'])
+            if now - coat_hanger.updated_at >= touch_interval:
+                coat_hanger.updated_at = now
+                db.session.commit()
             
             return coat_hanger, True
             
@@ -607,6 +693,48 @@ class AuthService:
         except Exception:
             return False
         
+    @staticmethod
+    def validate_password_strength(password):
+        """
+        Check a password against the password policy.
+        
+        Requires at least PASSWORD_MIN_LENGTH characters, matching the
+        minlength enforced by the registration form.
+        
+        Args:
+            password (str): Plain text password
+            
+        Returns:
+            tuple: (is_valid boolean, error message or None)
+        """
+        min_length = current_app.config['PASSWORD_MIN_LENGTH']
+        if not password or len(password) < min_length:
+            return False, f"Password must be at least {min_length} characters long"
+        
+        return True, None
+    
+    @staticmethod
+    def validate_registration_data(email, full_name, password, confirm_password):
+        """
+        Validate registration input without touching the database.
+        
+        Args:
+            email (str): Normalized email address
+            full_name (str): Stripped full name
+            password (str): Plain text password
+            confirm_password (str): Password confirmation
+            
+        Returns:
+            tuple: (is_valid boolean, error message or None)
+        """
+        if not email or not full_name or not password or not confirm_password:
+            return False, "All fields are required"
+        
+        if password != confirm_password:
+            return False, "Passwords do not match"
+        
+        return AuthService.validate_password_strength(password)
+    
     @staticmethod
     def register_user(user_data):
         """
@@ -624,12 +752,11 @@ class AuthService:
             password = user_data.get('password', '')
             confirm_password = user_data.get('confirm_password', '')
             
-            # Basic validations
-            if not email or not full_name or not password or not confirm_password:
-                return {'success': False, 'message': "All fields are required"}
-            
-            if password != confirm_password:
-                return {'success': False, 'message': "Passwords do not match"}
+            is_valid, error = AuthService.validate_registration_data(
+                email, full_name, password, confirm_password
+            )
+            if not is_valid:
+                return {'success': False, 'message': error}
             
             # Create user
             user, success, error = UserService.create_user(
@@ -1,3 +1,4 @@
+import hmac
 import secrets
 import hashlib
 from flask import session
@@ -5,14 +6,16 @@ from flask import session
 def generate_csrf_token():
     """Generate a CSRF token for forms."""
     if 'csrf_token' not in session:
-        session['csrf_token'] = secrets.token_hex(16)
+        session['csrf_token'] = secrets.token_bytes(32).hex()
     return session['csrf_token']
 
 def validate_csrf_token(token):
-    """Validate the submitted CSRF token."""
-    if 'csrf_token' not in session:
+    """Validate the submitted CSRF token with a constant-time comparison."""
+    expected = session.get('csrf_token')
+    if not expected or not isinstance(token, str):
         return False
-    return secrets.compare_digest(session['csrf_token'], token)
+    # Compare as bytes: compare_digest rejects non-ASCII str input with TypeError
+    return hmac.compare_digest(expected.encode('utf-8'), token.encode('utf-8'))
 
 def csrf_protect():
     """Decorator or function to protect routes from CSRF attacks."""
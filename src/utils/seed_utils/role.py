@@ -25,17 +25,24 @@ def seed_roles():
         }
     ]
     
+    # Look up existing roles in one query and insert the rest in one commit
+    existing_names = {name for (name,) in db.session.query(Role.name).all()}
+    new_roles = []
     for role_data in roles_data:
-        # Check if role already exists
-        existing_role = Role.find_one_by(name=role_data['name'])
-        if not existing_role:
-            try:
-                role = Role.create(**role_data)
-                print(f"Created role: {role.name}")
-            except Exception as e:
-                print(f"Error creating role {role_data['name']}: {str(e)}")
-        else:
+        if role_data['name'] in existing_names:
             print(f"Role {role_data['name']} already exists")
+        else:
+            new_roles.append(Role(**role_data))
+    
+    if new_roles:
+        try:
+            db.session.add_all(new_roles)
+            db.session.commit()
+            for role in new_roles:
+                print(f"Created role: {role.name}")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error creating roles: {str(e)}")
     
     print("Role seeding completed.")
 
@@ -1,7 +1,7 @@
 from src import db
 from src.models.user_model import User
 from src.models.role_model import Role
-from src.services.user_services import UserService
+from src.services.user_services import AuthService
 import logging
 
 
@@ -88,34 +88,43 @@ def seed_users():
             }
         ]
         
+        roles_by_name = {
+            'superuser': superuser_role,
+            'admin': admin_role,
+            'user': user_role
+        }
+        
         created_users = []
+        # Seed users share passwords, so hash each distinct one only once
+        password_hashes = {}
         
+        # The users table is empty at this point, so build every user in the
+        # session and write them all with a single commit
         for user_data in users_data:
-            # Create user using UserService
-            user, success, error = UserService.create_user(
-                email=user_data['email'],
-                full_name=user_data['full_name'],
-                password=user_data['password']
-            )
+            password = user_data['password']
+            if password not in password_hashes:
+                password_hashes[password] = AuthService.hash_password(password)
             
-            if not success:
-                logger.error(f"Failed to create user {user_data['email']}: {error}")
-                continue
+            user = User(
+                email=user_data['email'].lower().strip(),
+                full_name=user_data['full_name'].strip(),
+                password_hash=password_hashes[password]
+            )
             
             # Assign roles using the many-to-many relationship
             for role_name in user_data['roles']:
-                role = Role.query.filter_by(name=role_name).first()
+                role = roles_by_name.get(role_name)
                 if role:
-                    user.add_role(role)
+                    user.roles.append(role)
                 else:
                     logger.warning(f"Role '{role_name}' not found for user {user.email}")
             
-            # Save the user with roles
-            user.save()
             created_users.append(user)
-            logger.info(f"Created user: {user.email} with roles: {user_data['roles']}")
         
+        db.session.add_all(created_users)
         db.session.commit()
+        for user, user_data in zip(created_users, users_data):
+            logger.info(f"Created user: {user.email} with roles: {user_data['roles']}")
         logger.info(f"Successfully seeded {len(created_users)} users")
         
         return created_users
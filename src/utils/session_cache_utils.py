@@ -0,0 +1,73 @@
+"""
+Session Cache Utilities
+
+In-process cache of recently validated coat hanger sessions. Lets
+login_required skip the CoatHanger lookup for tokens that were checked
+within the last SESSION_TOUCH_INTERVAL seconds.
+
+Disabled by default; enable with SESSION_CACHE_ENABLED=True. Only safe when
+the app runs as a single process: logout and session revocation only clear
+the cache of the process that handled them, so other workers keep accepting
+a revoked session for up to SESSION_TOUCH_INTERVAL seconds.
+"""
+
+import hashlib
+from datetime import timedelta
+from src.utils import time_utils
+
+MAX_CACHED_SESSIONS = 10000
+
+# sha256(session token) -> (user_id, last activity timestamp)
+_session_cache = {}
+
+
+def _cache_key(session_token):
+    """Hash the session token so raw tokens are never kept in memory."""
+    return hashlib.sha256(session_token.encode('utf-8')).hexdigest()
+
+
+def get_cached_session(session_token, ttl_seconds):
+    """
+    Return the cached user id for a session token if it is still fresh.
+
+    Args:
+        session_token (str): Session token from the Flask session
+        ttl_seconds (int): Maximum age of the cached activity timestamp
+
+    Returns:
+        int: User id, or None on a miss or stale entry
+    """
+    entry = _session_cache.get(_cache_key(session_token))
+    if entry is None:
+        return None
+
+    user_id, touched_at = entry
+    if time_utils.utcnow() - touched_at >= timedelta(seconds=ttl_seconds):
+        return None
+    return user_id
+
+
+def cache_session(session_token, user_id, touched_at):
+    """
+    Remember a validated session token.
+
+    Args:
+        session_token (str): Session token from the Flask session
+        user_id (int): Id of the user owning the session
+        touched_at (datetime): Last activity timestamp stored in the database
+    """
+    if len(_session_cache) >= MAX_CACHED_SESSIONS:
+        _session_cache.clear()
+    _session_cache[_cache_key(session_token)] = (user_id, touched_at)
+
+
+def invalidate_session(session_token):
+    """Drop a single session token from the cache."""
+    _session_cache.pop(_cache_key(session_token), None)
+
+
+def invalidate_user_sessions(user_id):
+    """Drop every cached session belonging to a user."""
+    for key, (cached_user_id, _) in list(_session_cache.items()):
+        if cached_user_id == user_id:
+            _session_cache.pop(key, None)
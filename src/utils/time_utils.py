@@ -0,0 +1,14 @@
+"""
+Time Utilities
+
+Single source of the current time for session handling. Call it through
+the module (time_utils.utcnow()) so tests can swap in a fake clock
+instead of sleeping.
+"""
+
+from datetime import datetime
+
+
+def utcnow():
+    """Return the current time as a naive UTC datetime."""
+    return datetime.utcnow()